@@ -1,4 +1,5 @@
 import os
+from typing import Dict
 
 from dotenv import load_dotenv
 
@@ -12,21 +13,46 @@ def _get_env(name: str) -> str:
     return value
 
 
-MYSQL_HOST = _get_env("MYSQL_HOST")
-MYSQL_PORT = int(_get_env("MYSQL_PORT"))
-MYSQL_DATABASE = _get_env("MYSQL_DATABASE")
-MYSQL_USER = _get_env("MYSQL_USER")
-MYSQL_PASSWORD = _get_env("MYSQL_PASSWORD")
+def _parse_market_intervals(raw: str) -> Dict[str, int]:
+    """'KRW-BTC=5,KRW-ETH=10' 형식의 시장별 수집 주기(초) 파싱."""
+    intervals: Dict[str, int] = {}
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        market, sep, seconds = entry.partition("=")
+        if not sep or not seconds.strip().isdigit() or int(seconds) <= 0:
+            raise RuntimeError(f"Invalid COLLECT_MARKET_INTERVALS entry: {entry}")
+        intervals[market.strip()] = int(seconds)
+    return intervals
+
+
+def get_database_url() -> str:
+    """MySQL 접속 URL. 필수 환경 변수는 import 시점이 아닌 첫 DB 접속 시 확인."""
+    host = _get_env("MYSQL_HOST")
+    port = int(_get_env("MYSQL_PORT"))
+    database = _get_env("MYSQL_DATABASE")
+    user = _get_env("MYSQL_USER")
+    password = _get_env("MYSQL_PASSWORD")
+    return f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}?charset=utf8mb4"
+
+
+def _get_bool_env(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
 
 COLLECT_INTERVAL_SECONDS = int(os.getenv("COLLECT_INTERVAL_SECONDS", "60"))
+# 시장별 수집 주기 (예: "KRW-BTC=5,KRW-ETH=5"), 지정하지 않은 시장은 기본 주기
+COLLECT_MARKET_INTERVALS = _parse_market_intervals(os.getenv("COLLECT_MARKET_INTERVALS", ""))
+# 재접속 클라이언트 재전송용으로 메모리에 보관할 최근 알람 이벤트 수
+ALERT_OUTBOX_TAIL_SIZE = int(os.getenv("ALERT_OUTBOX_TAIL_SIZE", "1000"))
+# 시작 시 없는 테이블 자동 생성 여부 (기본 false: `python manage.py create-schema`로 별도 수행)
+AUTO_CREATE_SCHEMA = _get_bool_env("AUTO_CREATE_SCHEMA", "false")
+# 백그라운드 준비 작업(warmup) 실패 시 재시도 간격(초)
+WARMUP_RETRY_SECONDS = int(os.getenv("WARMUP_RETRY_SECONDS", "5"))
 
 UPBIT_TICKER_URL = "https://api.upbit.com/v1/ticker"
 DEFAULT_COINS = [
     {"symbol": "BTC", "name": "Bitcoin"},
     {"symbol": "ETH", "name": "Ethereum"},
 ]
-
-DATABASE_URL = (
-    f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/"
-    f"{MYSQL_DATABASE}?charset=utf8mb4"
-)
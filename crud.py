@@ -1,7 +1,8 @@
-from datetime import date, datetime
-from typing import List, Optional
+import json
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional
 
-from sqlalchemy import text
+from sqlalchemy import and_, bindparam, delete, func, insert, or_, text, update
 from sqlalchemy.orm import Session
 
 import models
@@ -22,6 +23,29 @@ def list_coins(db: Session) -> List[models.Coin]:
     return db.query(models.Coin).order_by(models.Coin.id.asc()).all()
 
 
+def list_coins_by_markets(db: Session, markets: Iterable[str]) -> List[models.Coin]:
+    """시장 코드 목록으로 조회."""
+    return db.query(models.Coin).filter(models.Coin.market.in_(list(markets))).all()
+
+
+def list_coins_by_ids(db: Session, coin_ids: Iterable[int]) -> List[models.Coin]:
+    """코인 ID 목록으로 조회."""
+    return (
+        db.query(models.Coin)
+        .filter(models.Coin.id.in_(list(coin_ids)))
+        .order_by(models.Coin.id.asc())
+        .all()
+    )
+
+
+def list_coin_ids(db: Session, coin_ids: Optional[Iterable[int]] = None) -> List[int]:
+    """코인 ID 목록 조회(ID 필터 지정 시 존재하는 ID만)."""
+    query = db.query(models.Coin.id)
+    if coin_ids is not None:
+        query = query.filter(models.Coin.id.in_(list(coin_ids)))
+    return [row.id for row in query.all()]
+
+
 def create_coin(
     db: Session,
     market: str,
@@ -56,6 +80,86 @@ def get_history(db: Session, coin_id: int, from_dt: datetime, to_dt: datetime) -
     )
 
 
+def get_candles(
+    db: Session,
+    coin_ids: List[int],
+    bucket_seconds: int,
+    from_dt: datetime,
+    to_dt: datetime,
+):
+    """히스토리를 bucket_seconds 단위 OHLCV 캔들로 집계(단일 GROUP BY)."""
+    # 버킷 시작 시각은 세션 타임존 영향이 없도록 epoch 기준 초로 계산
+    # open/close는 버킷 내 시간순 첫/마지막 가격 (GROUP_CONCAT 첫 항목만 사용)
+    # volume은 샘플별 누적 거래량(UTC 0시 기준) 증가분의 합:
+    # - 직전 샘플(LAG) 대비 증가분, 날짜가 바뀌었거나 그날 첫 샘플이면 누적값 자체
+    # - 직전 샘플의 누적 거래량이 없으면(컬럼 추가 이전) 알 수 없으므로 버킷 volume은 NULL
+    # 기간 첫 샘플의 직전 샘플을 찾기 위해 from_dt가 속한 날의 0시부터 읽음
+    statement = text(
+        """
+        SELECT
+            coin_id,
+            bucket,
+            SUBSTRING_INDEX(
+                GROUP_CONCAT(trade_price ORDER BY collected_at ASC, id ASC), ',', 1
+            ) + 0 AS open_price,
+            MAX(trade_price) AS high_price,
+            MIN(trade_price) AS low_price,
+            SUBSTRING_INDEX(
+                GROUP_CONCAT(trade_price ORDER BY collected_at DESC, id DESC), ',', 1
+            ) + 0 AS close_price,
+            CASE
+                WHEN COUNT(volume_delta) = COUNT(*) THEN SUM(volume_delta)
+            END AS volume,
+            COUNT(*) AS sample_count
+        FROM (
+            SELECT
+                id,
+                coin_id,
+                collected_at,
+                trade_price,
+                FLOOR(TIMESTAMPDIFF(SECOND, '1970-01-01 00:00:00', collected_at) / :bucket_seconds)
+                    * :bucket_seconds AS bucket,
+                CASE
+                    WHEN acc_trade_volume IS NULL THEN NULL
+                    WHEN prev_collected_at IS NULL
+                        OR DATE(prev_collected_at) <> DATE(collected_at) THEN acc_trade_volume
+                    WHEN prev_acc_trade_volume IS NULL THEN NULL
+                    WHEN acc_trade_volume < prev_acc_trade_volume THEN acc_trade_volume
+                    ELSE acc_trade_volume - prev_acc_trade_volume
+                END AS volume_delta
+            FROM (
+                SELECT
+                    id,
+                    coin_id,
+                    collected_at,
+                    trade_price,
+                    acc_trade_volume,
+                    LAG(collected_at) OVER w AS prev_collected_at,
+                    LAG(acc_trade_volume) OVER w AS prev_acc_trade_volume
+                FROM coin_history
+                WHERE coin_id IN :coin_ids
+                  AND collected_at >= :lag_from_dt
+                  AND collected_at <= :to_dt
+                WINDOW w AS (PARTITION BY coin_id ORDER BY collected_at, id)
+            ) AS samples
+            WHERE collected_at >= :from_dt
+        ) AS deltas
+        GROUP BY coin_id, bucket
+        ORDER BY coin_id, bucket
+        """
+    ).bindparams(bindparam("coin_ids", expanding=True))
+    return db.execute(
+        statement,
+        {
+            "coin_ids": coin_ids,
+            "bucket_seconds": bucket_seconds,
+            "lag_from_dt": datetime.combine(from_dt.date(), time.min),
+            "from_dt": from_dt,
+            "to_dt": to_dt,
+        },
+    ).all()
+
+
 def create_alert(db: Session, coin_id: int, condition_type: str, target_price: float) -> models.Alert:
     """알람 생성."""
     alert = models.Alert(
@@ -70,9 +174,72 @@ def create_alert(db: Session, coin_id: int, condition_type: str, target_price: f
     return alert
 
 
-def list_alerts(db: Session) -> List[models.Alert]:
-    """전체 알람 목록."""
-    return db.query(models.Alert).order_by(models.Alert.id.asc()).all()
+def bulk_create_alerts(db: Session, items: List[dict]) -> List[int]:
+    """알람 일괄 생성(단일 INSERT). 생성된 알람 ID 목록 반환."""
+    if not items:
+        return []
+    rows = [
+        {
+            "coin_id": item["coin_id"],
+            "condition_type": item["condition_type"],
+            "target_price": item["target_price"],
+            "is_active": True,
+        }
+        for item in items
+    ]
+    result = db.execute(insert(models.Alert).values(rows))
+    # 다중 행 INSERT는 첫 행의 ID를 돌려주며, 행 수가 정해진 INSERT의 ID는
+    # auto_increment_increment 간격으로 할당됨 (멀티 프라이머리 등에서는 1보다 클 수 있음)
+    first_id = result.lastrowid
+    count = result.rowcount
+    step = db.execute(text("SELECT @@auto_increment_increment")).scalar() or 1
+    db.commit()
+    return list(range(first_id, first_id + count * step, step))
+
+
+def list_alerts(
+    db: Session,
+    coin_id: Optional[int] = None,
+    is_active: Optional[bool] = None,
+    from_dt: Optional[datetime] = None,
+    to_dt: Optional[datetime] = None,
+) -> List[models.Alert]:
+    """알람 목록(코인/상태/생성 시각 필터)."""
+    query = db.query(models.Alert).order_by(models.Alert.id.asc())
+
+    if coin_id is not None:
+        query = query.filter(models.Alert.coin_id == coin_id)
+    if is_active is not None:
+        query = query.filter(models.Alert.is_active.is_(is_active))
+    if from_dt:
+        query = query.filter(models.Alert.alerts_created_at >= from_dt)
+    if to_dt:
+        query = query.filter(models.Alert.alerts_created_at <= to_dt)
+
+    return query.all()
+
+
+def deactivate_alerts(db: Session, alert_ids: List[int]) -> int:
+    """알람 일괄 비활성화. 변경된 행 수 반환."""
+    if not alert_ids:
+        return 0
+    result = db.execute(
+        update(models.Alert)
+        .where(models.Alert.id.in_(alert_ids))
+        .where(models.Alert.is_active.is_(True))
+        .values(is_active=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def delete_alerts(db: Session, alert_ids: List[int]) -> int:
+    """알람 일괄 삭제. 삭제된 행 수 반환."""
+    if not alert_ids:
+        return 0
+    result = db.execute(delete(models.Alert).where(models.Alert.id.in_(alert_ids)))
+    db.commit()
+    return result.rowcount
 
 
 def list_active_alerts_by_coin(db: Session, coin_id: int) -> List[models.Alert]:
@@ -86,18 +253,99 @@ def list_active_alerts_by_coin(db: Session, coin_id: int) -> List[models.Alert]:
     )
 
 
-def trigger_alert(db: Session, alert_id: int, triggered_at: datetime) -> Optional[models.Alert]:
-    """알람 트리거 처리(비활성화 + 트리거 시각 기록)."""
-    alert = db.query(models.Alert).filter(models.Alert.id == alert_id).first()
-    if not alert or not alert.is_active:
+def list_triggerable_alert_ids(db: Session, coin_id: int, trade_price: float) -> List[int]:
+    """현재 가격이 조건(GT/LT)을 만족하는 활성 알람 ID 목록."""
+    rows = (
+        db.query(models.Alert.id)
+        .filter(models.Alert.coin_id == coin_id)
+        .filter(models.Alert.is_active.is_(True))
+        .filter(
+            or_(
+                and_(models.Alert.condition_type == "GT", models.Alert.target_price <= trade_price),
+                and_(models.Alert.condition_type == "LT", models.Alert.target_price >= trade_price),
+            )
+        )
+        .order_by(models.Alert.id.asc())
+        .all()
+    )
+    return [row.id for row in rows]
+
+
+def trigger_alert(
+    db: Session,
+    alert_id: int,
+    triggered_at: datetime,
+    commit: bool = True,
+) -> Optional[models.Alert]:
+    """알람 트리거 처리(비활성화 + 트리거 시각 기록). commit=False면 커밋하지 않음.
+
+    세션에 캐시된 알람 상태가 아닌 DB의 현재 상태 기준으로 조건부 UPDATE 하므로,
+    그 사이 비활성화/삭제된 알람은 트리거되지 않는다.
+    """
+    result = db.execute(
+        update(models.Alert)
+        .where(models.Alert.id == alert_id)
+        .where(models.Alert.is_active.is_(True))
+        .values(is_active=False, alerts_triggered_at=triggered_at)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
         return None
-    alert.is_active = False
-    alert.alerts_triggered_at = triggered_at
-    db.commit()
-    db.refresh(alert)
+    # 세션에 남아 있던 이전 상태를 갱신된 행으로 덮어씀
+    alert = db.get(models.Alert, alert_id, populate_existing=True)
+    if commit:
+        db.commit()
+        db.refresh(alert)
     return alert
 
 
+def create_alert_event(db: Session, alert_id: int, event_type: str, payload: dict) -> models.AlertEvent:
+    """알람 이벤트를 outbox에 기록(보류 중인 변경과 함께 커밋)."""
+    event = models.AlertEvent(
+        alert_id=alert_id,
+        event_type=event_type,
+        payload=json.dumps(payload),
+    )
+    db.add(event)
+    db.commit()
+    db.refresh(event)
+    return event
+
+
+def list_alert_events_after(
+    db: Session,
+    after_id: int,
+    until_id: int,
+    limit: int,
+) -> List[models.AlertEvent]:
+    """커서 구간(after_id, until_id]의 알람 이벤트를 ID 오름차순으로 조회."""
+    return (
+        db.query(models.AlertEvent)
+        .filter(models.AlertEvent.id > after_id)
+        .filter(models.AlertEvent.id <= until_id)
+        .order_by(models.AlertEvent.id.asc())
+        .limit(limit)
+        .all()
+    )
+
+
+def count_alert_events_after(db: Session, after_id: int, until_id: int, limit: int) -> int:
+    """커서 구간(after_id, until_id]의 알람 이벤트 수(최대 limit까지만 셈)."""
+    ids = (
+        db.query(models.AlertEvent.id)
+        .filter(models.AlertEvent.id > after_id)
+        .filter(models.AlertEvent.id <= until_id)
+        .limit(limit)
+        .subquery()
+    )
+    return db.query(func.count()).select_from(ids).scalar()
+
+
+def get_last_alert_event_id(db: Session) -> int:
+    """가장 최근 알람 이벤트 ID(없으면 0)."""
+    return db.query(func.max(models.AlertEvent.id)).scalar() or 0
+
+
 def get_daily_stats(db: Session, coin_id: int, from_dt: Optional[datetime], to_dt: Optional[datetime]):
     """일별 통계 조회."""
     query = (
@@ -116,6 +364,7 @@ def get_daily_stats(db: Session, coin_id: int, from_dt: Optional[datetime], to_d
 
 def refresh_daily_stats_for_date(db: Session, coin_id: int, stats_date: date) -> None:
     """특정 날짜의 일별 통계 upsert."""
+    # collected_at을 함수로 감싸지 않고 범위로 비교해 (coin_id, collected_at) 인덱스를 사용
     db.execute(
         text(
             """
@@ -134,7 +383,8 @@ def refresh_daily_stats_for_date(db: Session, coin_id: int, stats_date: date) ->
                 AVG(trade_price) AS avg_price
             FROM coin_history
             WHERE coin_id = :coin_id
-              AND DATE(collected_at) = :stats_date
+              AND collected_at >= :day_start
+              AND collected_at < :day_end
             GROUP BY coin_id, DATE(collected_at)
             ON DUPLICATE KEY UPDATE
                 max_price = VALUES(max_price),
@@ -142,6 +392,10 @@ def refresh_daily_stats_for_date(db: Session, coin_id: int, stats_date: date) ->
                 avg_price = VALUES(avg_price)
             """
         ),
-        {"coin_id": coin_id, "stats_date": stats_date},
+        {
+            "coin_id": coin_id,
+            "day_start": datetime.combine(stats_date, time.min),
+            "day_end": datetime.combine(stats_date + timedelta(days=1), time.min),
+        },
     )
     db.commit()
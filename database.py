@@ -1,17 +1,70 @@
-from sqlalchemy import create_engine
+import threading
+from typing import Optional
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.schema import CreateColumn
+
+from config import get_database_url
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """SQLAlchemy 엔진을 처음 사용할 때 생성: 연결 유효성 확인/재활용 옵션 포함."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = create_engine(
+                get_database_url(),
+                pool_pre_ping=True,
+                pool_recycle=3600,
+            )
+    return _engine
+
+
+class _LazySessionMaker(sessionmaker):
+    """첫 세션 생성 시 엔진을 만들어 바인딩하는 세션 팩토리."""
 
-from config import DATABASE_URL
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
 
-# SQLAlchemy 엔진: 연결 유효성 확인/재활용 옵션 포함
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
 
 # 요청 단위로 사용할 세션 팩토리
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = _LazySessionMaker(autocommit=False, autoflush=False)
 
 # 모델 클래스의 베이스
 Base = declarative_base()
+
+
+def create_tables() -> None:
+    """없는 테이블만 생성(기존 테이블은 변경하지 않음)."""
+    import models  # noqa: F401  모델을 Base.metadata에 등록
+
+    Base.metadata.create_all(bind=get_engine())
+
+
+def create_schema() -> None:
+    """없는 테이블/컬럼/인덱스 생성(이미 있으면 변경 없음)."""
+    import models  # noqa: F401  모델을 Base.metadata에 등록
+
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    # create_all은 기존 테이블을 변경하지 않으므로 누락된 컬럼(nullable)/인덱스만 추가
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in columns and column.nullable:
+                    ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+    for table in Base.metadata.sorted_tables:
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in indexes:
+                index.create(bind=engine)
@@ -1,29 +1,32 @@
 import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from database import Base, engine
+from config import ALERT_OUTBOX_TAIL_SIZE
 from routers import alerts, coins
-from services.collector import start_collector, stop_collector
+from services.collector import stop_collector
+from services.outbox import AlertOutbox
+from services.warmup import start_warmup, stop_warmup
 from services.ws import ConnectionManager
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 리소스 초기화 및 정리."""
-    # 테이블 자동 생성(이미 있으면 변경 없음)
-    Base.metadata.create_all(bind=engine)
     # 웹소켓 매니저/이벤트 루프를 앱 상태에 저장
     app.state.ws_manager = ConnectionManager()
     app.state.ws_loop = asyncio.get_running_loop()
-    # 수집 스레드 시작
-    start_collector(app)
+    # 재접속 클라이언트 재전송용 알람 이벤트 outbox
+    app.state.alert_outbox = AlertOutbox(ALERT_OUTBOX_TAIL_SIZE)
+    # DB 준비 작업(스키마/기본 코인/캐시)과 수집 스레드 시작은 백그라운드로 진행
+    start_warmup(app)
     try:
         yield
     finally:
-        # 수집 스레드 종료
+        # 준비 작업/수집 스레드 종료
+        stop_warmup(app)
         stop_collector(app)
 
 
@@ -37,6 +40,21 @@ def index():
     """대시보드 HTML 제공."""
     return FileResponse("static/index.html")
 
+@app.get("/healthz")
+async def healthz():
+    """프로세스 생존 확인(liveness)."""
+    return {"status": "ok"}
+
+@app.get("/readyz")
+async def readyz(request: Request):
+    """준비 작업 완료 여부(readiness). 완료 전에는 503."""
+    state = request.app.state
+    if not getattr(state, "ready", False):
+        # 실패 상세(DB 주소 등)는 로그에만 남김
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    scheduler = getattr(state, "collector_scheduler", None)
+    return {"status": "ready", "collector": scheduler.stats() if scheduler else []}
+
 # API 라우터 등록
 app.include_router(coins.router)
 app.include_router(alerts.router)
@@ -0,0 +1,23 @@
+import argparse
+import logging
+
+from database import create_schema
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """스키마 관리 CLI (배포 시 앱 기동 전에 실행)."""
+    parser = argparse.ArgumentParser(description="Crypto Price Collector management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("create-schema", help="create missing tables, nullable columns and indexes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "create-schema":
+        create_schema()
+        logger.info("Schema is up to date")
+
+
+if __name__ == "__main__":
+    main()
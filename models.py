@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.dialects.mysql import BIGINT, DECIMAL, DOUBLE, INTEGER
 from sqlalchemy.orm import relationship
 
@@ -22,13 +22,19 @@ class Coin(Base):
 
 class CoinHistory(Base):
     __tablename__ = "coin_history"
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        # 코인별 기간 조회(히스토리/캔들 집계)용 복합 인덱스
+        Index("ix_coin_history_coin_id_collected_at", "coin_id", "collected_at"),
+        {"mysql_engine": "InnoDB"},
+    )
 
     # 시계열 히스토리
     id = Column(BIGINT, primary_key=True, index=True)
     coin_id = Column(BIGINT, ForeignKey("coins.id"), nullable=False, index=True)
     trade_price = Column(DOUBLE, nullable=False)
     trade_volume = Column(DOUBLE, nullable=False)
+    # UTC 0시 기준 누적 거래량 (캔들 거래량 계산용, 추가 이전 데이터는 NULL)
+    acc_trade_volume = Column(DOUBLE, nullable=True)
     trade_timestamp = Column(INTEGER, nullable=False)
     opening_price = Column(DOUBLE, nullable=False)
     high_price = Column(DOUBLE, nullable=False)
@@ -57,6 +63,19 @@ class Alert(Base):
     coin = relationship("Coin", back_populates="alerts")
 
 
+class AlertEvent(Base):
+    __tablename__ = "alert_events"
+    __table_args__ = {"mysql_engine": "InnoDB"}
+
+    # 알람 이벤트 outbox (append-only, id가 재전송 커서)
+    # 알람 삭제 후에도 이벤트 로그는 남도록 FK를 두지 않음
+    id = Column(BIGINT, primary_key=True, index=True)
+    alert_id = Column(BIGINT, nullable=False, index=True)
+    event_type = Column(String(30), nullable=False)
+    payload = Column(Text, nullable=False)
+    event_created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
 class DailyCoinStatistics(Base):
     __tablename__ = "daily_coin_statistics"
     __table_args__ = {"mysql_engine": "InnoDB"}
@@ -1,13 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, WebSocket
+from datetime import date, datetime, time
+from typing import List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket
+from starlette.concurrency import run_in_threadpool
 from starlette.websockets import WebSocketDisconnect
 from sqlalchemy.orm import Session
 
 import crud
 import schemas
 from database import SessionLocal
+from services import coin_registry
+from services.outbox import AlertOutbox, to_message
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
+# DB 재전송 시 한 번에 읽을 이벤트 수
+REPLAY_PAGE_SIZE = 500
+# 재접속 시 재전송할 최대 이벤트 수 (초과하면 reset 메시지로 전체 재조회 안내)
+REPLAY_MAX_EVENTS = 1000
+
 
 def get_db():
     """요청 단위 DB 세션 생성/해제."""
@@ -27,19 +38,151 @@ def create_alert(payload: schemas.AlertCreate, db: Session = Depends(get_db)):
     return crud.create_alert(db, payload.coin_id, payload.condition_type, payload.target_price)
 
 
+@router.post("/bulk", response_model=schemas.AlertBulkCreateOut)
+def bulk_create_alerts(payload: schemas.AlertBulkCreate, db: Session = Depends(get_db)):
+    """알람 일괄 생성. 코인은 캐시 기준으로 한 번에 검증."""
+    missing = coin_registry.find_missing(db, (item.coin_id for item in payload.items))
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"coin not found: {sorted(missing)}",
+        )
+    ids = crud.bulk_create_alerts(db, [item.model_dump() for item in payload.items])
+    return schemas.AlertBulkCreateOut(ids=ids)
+
+
+@router.post("/bulk/deactivate", response_model=schemas.AlertBulkResultOut)
+def bulk_deactivate_alerts(payload: schemas.AlertIdsIn, db: Session = Depends(get_db)):
+    """알람 일괄 비활성화."""
+    count = crud.deactivate_alerts(db, payload.ids)
+    return schemas.AlertBulkResultOut(count=count)
+
+
+@router.post("/bulk/delete", response_model=schemas.AlertBulkResultOut)
+def bulk_delete_alerts(payload: schemas.AlertIdsIn, db: Session = Depends(get_db)):
+    """알람 일괄 삭제."""
+    count = crud.delete_alerts(db, payload.ids)
+    return schemas.AlertBulkResultOut(count=count)
+
+
 @router.get("", response_model=schemas.AlertListOut)
-def list_alerts(db: Session = Depends(get_db)):
-    """전체 알람 목록."""
-    items = crud.list_alerts(db)
+def list_alerts(
+    coin_id: Optional[int] = None,
+    is_active: Optional[bool] = None,
+    from_date: Optional[date] = Query(None, alias="from"),
+    to_date: Optional[date] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+):
+    """알람 목록(코인/활성 여부/생성일 기간 필터)."""
+    from_dt = datetime.combine(from_date, time.min) if from_date else None
+    to_dt = datetime.combine(to_date, time.max) if to_date else None
+    items = crud.list_alerts(db, coin_id=coin_id, is_active=is_active, from_dt=from_dt, to_dt=to_dt)
     return schemas.AlertListOut(items=[schemas.AlertOut.model_validate(i) for i in items])
 
 
+@router.get("/events/stats", response_model=schemas.AlertOutboxStatsOut)
+def alert_event_stats(request: Request):
+    """알람 이벤트 전달 지연/재전송 지표."""
+    return schemas.AlertOutboxStatsOut(**request.app.state.alert_outbox.stats())
+
+
+def _load_replay_window(last_event_id: int) -> Tuple[int, int]:
+    """재전송 구간 상한(현재 마지막 이벤트 ID)과 구간 내 이벤트 수(한도+1까지) 조회."""
+    db = SessionLocal()
+    try:
+        head_id = crud.get_last_alert_event_id(db)
+        count = crud.count_alert_events_after(db, last_event_id, head_id, REPLAY_MAX_EVENTS + 1)
+        return head_id, count
+    finally:
+        db.close()
+
+
+def _load_events_page(after_id: int, until_id: int) -> List[dict]:
+    """재전송 구간의 이벤트 한 페이지 조회."""
+    db = SessionLocal()
+    try:
+        events = crud.list_alert_events_after(db, after_id, until_id, REPLAY_PAGE_SIZE)
+        return [to_message(e) for e in events]
+    finally:
+        db.close()
+
+
+async def _send_reset(websocket: WebSocket, outbox: AlertOutbox, head_id: int) -> int:
+    """놓친 이벤트가 재전송 한도를 넘으면 전체 재조회를 안내하고 커서를 head로 이동."""
+    await websocket.send_json({"type": "reset", "last_event_id": head_id})
+    outbox.record_replay_reset()
+    return head_id
+
+
+async def _send_replayed(websocket: WebSocket, message: dict) -> None:
+    """재전송 이벤트 전송. 클라이언트가 알림을 묶을 수 있도록 replayed 표시(tail 원본은 변경하지 않음)."""
+    await websocket.send_json({**message, "replayed": True})
+
+
+async def _replay_events(websocket: WebSocket, outbox: AlertOutbox, last_event_id: int) -> int:
+    """놓친 이벤트 재전송(메모리 tail 우선, 없으면 DB를 페이지 단위로). 마지막으로 보낸 ID 반환."""
+    messages = outbox.since(last_event_id)
+    if messages is not None:
+        if len(messages) > REPLAY_MAX_EVENTS:
+            return await _send_reset(websocket, outbox, messages[-1]["event_id"])
+        for message in messages:
+            await _send_replayed(websocket, message)
+        await websocket.send_json({"type": "replay_done", "count": len(messages)})
+        outbox.record_replay(len(messages), from_db=False)
+        return messages[-1]["event_id"] if messages else last_event_id
+
+    # 구간 상한 이후 이벤트는 연결 등록 후 발생했으므로 버퍼로 전달됨
+    head_id, count = await run_in_threadpool(_load_replay_window, last_event_id)
+    if count > REPLAY_MAX_EVENTS:
+        return await _send_reset(websocket, outbox, head_id)
+
+    cursor = last_event_id
+    sent = 0
+    while True:
+        page = await run_in_threadpool(_load_events_page, cursor, head_id)
+        for message in page:
+            await _send_replayed(websocket, message)
+        sent += len(page)
+        if page:
+            cursor = page[-1]["event_id"]
+        if len(page) < REPLAY_PAGE_SIZE:
+            break
+    await websocket.send_json({"type": "replay_done", "count": sent})
+    outbox.record_replay(sent, from_db=True)
+    return cursor
+
+
+def _load_head_id() -> int:
+    """DB의 마지막 이벤트 ID 조회."""
+    db = SessionLocal()
+    try:
+        return crud.get_last_alert_event_id(db)
+    finally:
+        db.close()
+
+
+async def _current_head_id(outbox: AlertOutbox) -> int:
+    """현재 마지막 이벤트 ID(outbox 준비 전이면 DB 조회)."""
+    head_id = outbox.head_id()
+    if head_id is not None:
+        return head_id
+    return await run_in_threadpool(_load_head_id)
+
+
 @router.websocket("/ws")
-async def alerts_ws(websocket: WebSocket):
-    """알람 트리거 이벤트를 받는 웹소켓."""
+async def alerts_ws(websocket: WebSocket, last_event_id: Optional[int] = None):
+    """알람 트리거 이벤트를 받는 웹소켓. last_event_id 이후 이벤트는 재전송."""
     manager = websocket.app.state.ws_manager
-    await manager.connect(websocket)
+    outbox = websocket.app.state.alert_outbox
+    # 재전송 전에 연결을 등록하되, 그동안의 실시간 이벤트는 버퍼에 보관했다가 재전송 뒤 순서대로 전송
+    await manager.connect(websocket, buffered=True)
     try:
+        if last_event_id is None:
+            sent_id = await _current_head_id(outbox)
+            await websocket.send_json({"type": "hello", "last_event_id": sent_id})
+        else:
+            sent_id = await _replay_events(websocket, outbox, last_event_id)
+        await manager.flush_buffered(websocket, sent_id)
         while True:
             await websocket.receive_text()
     except WebSocketDisconnect:
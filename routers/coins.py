@@ -1,5 +1,6 @@
-from datetime import date, datetime, time
-from typing import List, Optional
+import math
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
@@ -7,9 +8,19 @@ from sqlalchemy.orm import Session
 import crud
 import schemas
 from database import SessionLocal
+from services import coin_registry
 
 router = APIRouter(prefix="/coins", tags=["coins"])
 
+# 캔들 간격별 버킷 크기(초)
+CANDLE_INTERVAL_SECONDS = {"1m": 60, "5m": 300, "1h": 3600, "1d": 86400}
+# 다중 코인 캔들 조회 시 최대 코인 수
+MAX_CANDLE_COINS = 50
+# 코인당 / 요청 전체 최대 캔들 수
+MAX_CANDLES_PER_COIN = 1500
+MAX_CANDLES_PER_REQUEST = 20000
+EPOCH = datetime(1970, 1, 1)
+
 
 def get_db():
     """요청 단위 DB 세션 생성/해제."""
@@ -26,12 +37,14 @@ def create_coin(payload: schemas.CoinCreate, db: Session = Depends(get_db)):
     exists = crud.get_coin_by_market(db, payload.market)
     if exists:
         return exists
-    return crud.create_coin(
+    coin = crud.create_coin(
         db,
         payload.market,
         korean_name=payload.korean_name,
         english_name=payload.english_name,
     )
+    coin_registry.add(coin.id)
+    return coin
 
 
 @router.get("", response_model=List[schemas.CoinOut])
@@ -41,6 +54,101 @@ def list_coins(db: Session = Depends(get_db)):
     return [schemas.CoinOut.model_validate(item) for item in items]
 
 
+def _check_candle_range(from_dt: datetime, to_dt: datetime, interval: str, coin_count: int) -> None:
+    """요청 기간의 캔들 수가 한도를 넘으면 400."""
+    if from_dt > to_dt:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    seconds = CANDLE_INTERVAL_SECONDS[interval]
+    buckets = math.ceil((to_dt - from_dt).total_seconds() / seconds)
+    if buckets > MAX_CANDLES_PER_COIN:
+        raise HTTPException(
+            status_code=400,
+            detail=f"range too long for interval {interval} (max {MAX_CANDLES_PER_COIN} candles)",
+        )
+    if buckets * coin_count > MAX_CANDLES_PER_REQUEST:
+        raise HTTPException(
+            status_code=400,
+            detail=f"too many candles requested (max {MAX_CANDLES_PER_REQUEST} per request)",
+        )
+
+
+def _load_candles(
+    db: Session,
+    coins: List,
+    interval: str,
+    from_date: date,
+    to_date: date,
+) -> List[schemas.CandlesOut]:
+    """코인 목록의 캔들을 한 번의 집계 쿼리로 조회해 코인별로 분배."""
+    from_dt = datetime.combine(from_date, time.min)
+    to_dt = datetime.combine(to_date, time.max)
+    _check_candle_range(from_dt, to_dt, interval, len(coins))
+    rows = crud.get_candles(
+        db,
+        [coin.id for coin in coins],
+        CANDLE_INTERVAL_SECONDS[interval],
+        from_dt,
+        to_dt,
+    )
+
+    candles: Dict[int, List[schemas.CandleOut]] = {coin.id: [] for coin in coins}
+    for row in rows:
+        candles[row.coin_id].append(
+            schemas.CandleOut(
+                time=EPOCH + timedelta(seconds=int(row.bucket)),
+                open=float(row.open_price),
+                high=float(row.high_price),
+                low=float(row.low_price),
+                close=float(row.close_price),
+                volume=float(row.volume) if row.volume is not None else None,
+                count=row.sample_count,
+            )
+        )
+
+    return [
+        schemas.CandlesOut(coin_id=coin.id, market=coin.market, interval=interval, items=candles[coin.id])
+        for coin in coins
+    ]
+
+
+@router.get("/candles", response_model=schemas.CandlesListOut)
+def get_candles_multi(
+    coin_ids: List[int] = Query(..., alias="coin_id"),
+    interval: schemas.CandleInterval = "1m",
+    from_date: date = Query(..., alias="from"),
+    to_date: date = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+):
+    """여러 코인의 기간 내 OHLCV 캔들 조회 (coin_id 반복 지정)."""
+    unique_ids = sorted(set(coin_ids))
+    if len(unique_ids) > MAX_CANDLE_COINS:
+        raise HTTPException(status_code=400, detail=f"too many coins (max {MAX_CANDLE_COINS})")
+
+    coins = crud.list_coins_by_ids(db, unique_ids)
+    missing = set(unique_ids) - {coin.id for coin in coins}
+    if missing:
+        raise HTTPException(status_code=404, detail=f"coin not found: {sorted(missing)}")
+
+    items = _load_candles(db, coins, interval, from_date, to_date)
+    return schemas.CandlesListOut(interval=interval, items=items)
+
+
+@router.get("/{coin_id}/candles", response_model=schemas.CandlesOut)
+def get_candles(
+    coin_id: int,
+    interval: schemas.CandleInterval = "1m",
+    from_date: date = Query(..., alias="from"),
+    to_date: date = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+):
+    """기간 내 OHLCV 캔들 조회 (interval: 1m/5m/1h/1d)."""
+    coin = crud.get_coin_by_id(db, coin_id)
+    if not coin:
+        raise HTTPException(status_code=404, detail="coin not found")
+
+    return _load_candles(db, [coin], interval, from_date, to_date)[0]
+
+
 @router.get("/{coin_id}/history", response_model=schemas.HistoryOut)
 def get_history(
     coin_id: int,
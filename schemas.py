@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -36,6 +36,35 @@ class HistoryOut(BaseModel):
     items: List[PriceOut]
 
 
+CandleInterval = Literal["1m", "5m", "1h", "1d"]
+
+
+class CandleOut(BaseModel):
+    """OHLCV 캔들 단건 (time: 버킷 시작 시각)."""
+    time: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    # 직전 샘플 이후 버킷 마지막 샘플까지의 누적 거래량 증가분 (누적 거래량 미수집 구간은 None)
+    volume: Optional[float]
+    count: int
+
+
+class CandlesOut(BaseModel):
+    """코인별 캔들 응답."""
+    coin_id: int
+    market: str
+    interval: CandleInterval
+    items: List[CandleOut]
+
+
+class CandlesListOut(BaseModel):
+    """여러 코인 캔들 응답."""
+    interval: CandleInterval
+    items: List[CandlesOut]
+
+
 class AlertCreate(BaseModel):
     """알람 생성 요청."""
     coin_id: int
@@ -51,6 +80,26 @@ class AlertCreate(BaseModel):
         return value
 
 
+class AlertBulkCreate(BaseModel):
+    """알람 일괄 생성 요청."""
+    items: List[AlertCreate] = Field(..., min_length=1, max_length=5000)
+
+
+class AlertBulkCreateOut(BaseModel):
+    """알람 일괄 생성 응답(생성된 ID 목록)."""
+    ids: List[int]
+
+
+class AlertIdsIn(BaseModel):
+    """알람 ID 목록 요청(일괄 비활성화/삭제)."""
+    ids: List[int] = Field(..., min_length=1, max_length=5000)
+
+
+class AlertBulkResultOut(BaseModel):
+    """일괄 처리 결과(영향받은 알람 수)."""
+    count: int
+
+
 class AlertOut(BaseModel):
     """알람 응답."""
     id: int
@@ -69,6 +118,23 @@ class AlertListOut(BaseModel):
     items: List[AlertOut]
 
 
+class AlertOutboxStatsOut(BaseModel):
+    """알람 이벤트 전달/재전송 지표."""
+    head_event_id: Optional[int]
+    tail_size: int
+    broadcasts: int
+    delivered: int
+    delivery_failures: int
+    latency_last_ms: float
+    latency_max_ms: float
+    latency_avg_ms: float
+    replays: int
+    replays_from_db: int
+    replayed_events: int
+    replay_max: int
+    replay_resets: int
+
+
 class StatsOut(BaseModel):
     """일별 통계 단건."""
     coin_id: int
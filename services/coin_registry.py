@@ -0,0 +1,39 @@
+import threading
+from typing import Iterable, Set
+
+from sqlalchemy.orm import Session
+
+import crud
+
+# 프로세스 내 코인 ID 캐시 (알람 일괄 생성 시 코인 검증용)
+_coin_ids: Set[int] = set()
+_lock = threading.Lock()
+
+
+def warmup(db: Session) -> None:
+    """DB의 코인 ID 전체를 캐시에 적재."""
+    coin_ids = crud.list_coin_ids(db)
+    with _lock:
+        _coin_ids.clear()
+        _coin_ids.update(coin_ids)
+
+
+def add(coin_id: int) -> None:
+    """새로 생성된 코인 ID를 캐시에 추가."""
+    with _lock:
+        _coin_ids.add(coin_id)
+
+
+def find_missing(db: Session, coin_ids: Iterable[int]) -> Set[int]:
+    """존재하지 않는 코인 ID 반환. 캐시에 없는 ID만 DB에서 한 번에 재확인."""
+    requested = set(coin_ids)
+    with _lock:
+        unknown = requested - _coin_ids
+    if not unknown:
+        return set()
+
+    # 다른 프로세스에서 생성된 코인일 수 있으므로 캐시 미스는 DB로 확인
+    found = set(crud.list_coin_ids(db, unknown))
+    with _lock:
+        _coin_ids.update(found)
+    return unknown - found
@@ -1,85 +1,133 @@
 import asyncio
 import logging
 import threading
+import time
 from datetime import datetime
+from functools import partial
 from typing import Dict, Optional
 
 import requests
 
 import crud
-import models
 import schemas
-from config import COLLECT_INTERVAL_SECONDS, DEFAULT_COINS, UPBIT_TICKER_URL
+from config import (
+    COLLECT_INTERVAL_SECONDS,
+    COLLECT_MARKET_INTERVALS,
+    DEFAULT_COINS,
+    UPBIT_TICKER_URL,
+)
 from database import SessionLocal
+from services import coin_registry
+from services.outbox import AlertOutbox, to_message
+from services.scheduler import TickScheduler
 
 _ws_manager = None
 _ws_loop: Optional[asyncio.AbstractEventLoop] = None
+_outbox: Optional[AlertOutbox] = None
+# 수집 주기별 작업이 서로 다른 스레드에서 실행되므로 공유 쓰기 구간 보호
+# - 기본 코인 초기 삽입 중복 방지
+# - 알람 이벤트 ID가 커밋/전파 순서와 같도록 트리거~전파 직렬화
+_seed_lock = threading.Lock()
+_event_lock = threading.Lock()
 logger = logging.getLogger(__name__)
 
 
-def _should_trigger(alert: models.Alert, trade_price: float) -> bool:
-    """알람 조건(GT/LT)이 현재 가격을 만족하는지 판단."""
-    target = float(alert.target_price)
-    if alert.condition_type == "GT":
-        return trade_price >= target
-    if alert.condition_type == "LT":
-        return trade_price <= target
-    return False
+def _interval_for(market: str) -> int:
+    """시장별 수집 주기(초)."""
+    return COLLECT_MARKET_INTERVALS.get(market, COLLECT_INTERVAL_SECONDS)
 
 
-def _broadcast_alert(payload: dict) -> None:
-    """웹소켓으로 알람 트리거 이벤트 전파."""
+def _on_broadcast_done(event_id: int, started: float, future) -> None:
+    """브로드캐스트 완료 시 전달 지연/실패 기록."""
+    if future.cancelled():
+        logger.warning("Alert event %s broadcast cancelled", event_id)
+        return
+    exc = future.exception()
+    if exc is not None:
+        if _outbox:
+            _outbox.record_delivery_failure()
+        logger.error("Alert event %s broadcast failed", event_id, exc_info=exc)
+        return
+    latency = time.monotonic() - started
+    if _outbox:
+        _outbox.record_delivery(latency, future.result())
+    logger.debug("Alert event %s delivered in %.1f ms", event_id, latency * 1000)
+
+
+def _broadcast_alert(message: dict) -> None:
+    """outbox tail에 이벤트 추가 후 웹소켓으로 전파(끊긴 클라이언트는 재접속 시 재전송)."""
+    started = time.monotonic()
+    if _outbox:
+        _outbox.append(message)
     if not _ws_manager or not _ws_loop:
         return
     try:
-        asyncio.run_coroutine_threadsafe(_ws_manager.broadcast_json(payload), _ws_loop)
-    except Exception:
-        pass
+        future = asyncio.run_coroutine_threadsafe(_ws_manager.broadcast_json(message), _ws_loop)
+    except RuntimeError:
+        # 이벤트 루프 종료(셧다운 중): 이벤트는 DB에 남아 재접속 시 재전송됨
+        logger.warning("Alert event %s not broadcast: event loop closed", message["event_id"])
+        return
+    future.add_done_callback(partial(_on_broadcast_done, message["event_id"], started))
 
 
 def set_ws_context(app) -> None:
-    """FastAPI 앱 상태에 있는 웹소켓 매니저/루프를 주입."""
-    global _ws_manager, _ws_loop
+    """FastAPI 앱 상태에 있는 웹소켓 매니저/루프/outbox를 주입."""
+    global _ws_manager, _ws_loop, _outbox
     _ws_manager = getattr(app.state, "ws_manager", None)
     _ws_loop = getattr(app.state, "ws_loop", None)
+    _outbox = getattr(app.state, "alert_outbox", None)
+
+
+def warmup_outbox() -> None:
+    """DB의 마지막 이벤트 ID로 outbox tail 기준점 설정."""
+    if not _outbox:
+        return
+    db = SessionLocal()
+    try:
+        _outbox.set_floor(crud.get_last_alert_event_id(db))
+    finally:
+        db.close()
 
 
 def ensure_default_coins():
     """기본 코인(BTC/ETH)이 없으면 초기 삽입."""
     db = SessionLocal()
     try:
-        for item in DEFAULT_COINS:
-            market = f"KRW-{item['symbol']}"
-            exists = crud.get_coin_by_market(db, market)
-            if not exists:
+        defaults = {f"KRW-{item['symbol']}": item for item in DEFAULT_COINS}
+        # 기본 코인 존재 여부를 한 번의 쿼리로 확인
+        existing = {coin.market for coin in crud.list_coins_by_markets(db, defaults)}
+        for market, item in defaults.items():
+            if market not in existing:
                 crud.create_coin(
                     db,
                     market,
                     korean_name=item["symbol"],
                     english_name=item["name"],
                 )
+        # 알람 일괄 생성 시 사용하는 코인 ID 캐시 적재
+        coin_registry.warmup(db)
     finally:
         db.close()
 
 
-def fetch_prices():
-    """업비트 API에서 시세 수집 -> 히스토리 저장 -> 통계/알람 갱신."""
+def fetch_prices(interval: Optional[int] = None):
+    """업비트 API에서 시세 수집 -> 히스토리 저장 -> 통계/알람 갱신.
+
+    interval을 지정하면 해당 수집 주기에 속한 시장만 수집한다.
+    """
     db = SessionLocal()
     try:
         coins = crud.list_coins(db)
         if not coins:
-            for item in DEFAULT_COINS:
-                market = f"KRW-{item['symbol']}"
-                crud.create_coin(
-                    db,
-                    market,
-                    korean_name=item["symbol"],
-                    english_name=item["name"],
-                )
+            with _seed_lock:
+                ensure_default_coins()
             coins = crud.list_coins(db)
+        if interval is not None:
+            coins = [c for c in coins if _interval_for(c.market) == interval]
 
         market_list = [c.market for c in coins]
-        coin_map: Dict[str, models.Coin] = {c.market: c for c in coins}
+        # 루프 중 커밋으로 ORM 객체가 만료되므로 ID만 보관
+        coin_ids: Dict[str, int] = {c.market: c.id for c in coins}
         markets = ",".join(market_list)
         if not markets:
             return
@@ -94,8 +142,8 @@ def fetch_prices():
 
         for item in data:
             market = item.get("market", "")
-            coin = coin_map.get(market)
-            if not coin:
+            coin_id = coin_ids.get(market)
+            if not coin_id:
                 continue
             trade_timestamp = int(item.get("trade_timestamp", 0))
             if trade_timestamp > 2_147_483_647:
@@ -104,6 +152,9 @@ def fetch_prices():
             payload = {
                 "trade_price": float(item.get("trade_price", 0)),
                 "trade_volume": float(item.get("trade_volume", 0)),
+                "acc_trade_volume": (
+                    float(item["acc_trade_volume"]) if item.get("acc_trade_volume") is not None else None
+                ),
                 "trade_timestamp": trade_timestamp,
                 "opening_price": float(item.get("opening_price", 0)),
                 "high_price": float(item.get("high_price", 0)),
@@ -114,17 +165,26 @@ def fetch_prices():
                 "collected_at": datetime.utcnow(),
             }
             # 시세 히스토리 저장
-            crud.add_history(db, coin.id, payload)
-            updated_coin_ids.add(coin.id)
-
-            trade_price = payload["trade_price"]
-            alerts = crud.list_active_alerts_by_coin(db, coin.id)
-            for alert in alerts:
-                if _should_trigger(alert, trade_price):
-                    triggered = crud.trigger_alert(db, alert.id, datetime.utcnow())
-                    if triggered:
-                        alert_out = schemas.AlertOut.model_validate(triggered).model_dump()
-                        _broadcast_alert({"type": "alert_triggered", "alert": alert_out})
+            crud.add_history(db, coin_id, payload)
+            updated_coin_ids.add(coin_id)
+
+            # 조건 판단은 SQL에서 ID만 조회: 커밋마다 만료되는 ORM 객체를 다시 읽지 않음
+            alert_ids = crud.list_triggerable_alert_ids(db, coin_id, payload["trade_price"])
+            for alert_id in alert_ids:
+                with _event_lock:
+                    # 알람 상태 변경과 outbox 이벤트를 한 트랜잭션으로 커밋
+                    # (그 사이 비활성화/삭제된 알람은 조건부 UPDATE에서 걸러짐)
+                    triggered = crud.trigger_alert(db, alert_id, datetime.utcnow(), commit=False)
+                    if not triggered:
+                        continue
+                    alert_out = schemas.AlertOut.model_validate(triggered).model_dump(mode="json")
+                    event = crud.create_alert_event(
+                        db,
+                        triggered.id,
+                        "alert_triggered",
+                        {"alert": alert_out},
+                    )
+                    _broadcast_alert(to_message(event))
 
         # 하루 단위 통계 갱신
         for coin_id in updated_coin_ids:
@@ -133,37 +193,30 @@ def fetch_prices():
         db.close()
 
 
-def _collector_loop(stop_event: threading.Event, interval: int):
-    """주기적 수집 루프(스레드)."""
-    while not stop_event.is_set():
-        try:
-            fetch_prices()
-        except Exception:
-            logger.exception("Collector loop failed")
-        stop_event.wait(interval)
-
-
-def start_collector(app):
-    """수집 스레드 시작 및 앱 상태에 핸들 보관."""
+def start_collector(app, stop_event: Optional[threading.Event] = None):
+    """수집 스레드 시작 및 앱 상태에 핸들 보관. stop_event가 이미 설정됐으면 시작하지 않음."""
+    stop_event = stop_event or threading.Event()
     ensure_default_coins()
     set_ws_context(app)
-    stop_event = threading.Event()
-    thread = threading.Thread(
-        target=_collector_loop,
-        args=(stop_event, COLLECT_INTERVAL_SECONDS),
-        daemon=True,
-    )
+    warmup_outbox()
+    if stop_event.is_set():
+        return
+    # 수집 주기별로 작업을 등록해 같은 주기의 시장은 한 번의 API 호출로 수집
+    scheduler = TickScheduler(stop_event)
+    intervals = {COLLECT_INTERVAL_SECONDS, *COLLECT_MARKET_INTERVALS.values()}
+    for interval in sorted(intervals):
+        scheduler.add_job(f"collect-{interval}s", interval, partial(fetch_prices, interval))
     app.state.collector_stop_event = stop_event
-    app.state.collector_thread = thread
-    thread.start()
+    app.state.collector_scheduler = scheduler
+    scheduler.start()
 
 
 def stop_collector(app):
     """수집 스레드 종료."""
     stop_event = getattr(app.state, "collector_stop_event", None)
-    thread = getattr(app.state, "collector_thread", None)
+    scheduler = getattr(app.state, "collector_scheduler", None)
     if stop_event:
         stop_event.set()
-    if thread:
-        thread.join(timeout=5)
+    if scheduler:
+        scheduler.join(timeout=5)
 
@@ -0,0 +1,122 @@
+import json
+import threading
+from collections import deque
+from typing import Deque, List, Optional
+
+import models
+
+
+def to_message(event: models.AlertEvent) -> dict:
+    """DB 이벤트 행을 웹소켓 메시지로 변환."""
+    message = {
+        "type": event.event_type,
+        "event_id": event.id,
+        "created_at": event.event_created_at.isoformat() if event.event_created_at else None,
+    }
+    message.update(json.loads(event.payload))
+    return message
+
+
+class AlertOutbox:
+    """최근 알람 이벤트 메모리 tail + 전달/재전송 지표."""
+
+    def __init__(self, tail_size: int) -> None:
+        # 최근 이벤트 메시지 (event_id 오름차순)
+        self._tail: Deque[dict] = deque()
+        self._tail_size = tail_size
+        # 이 ID 이후의 이벤트는 모두 tail에 있음 (None이면 DB 기준점 미확인)
+        self._floor_id: Optional[int] = None
+        self._head_id: Optional[int] = None
+        # 동시 접근 보호용 락 (수집 스레드 <-> 이벤트 루프)
+        self._lock = threading.Lock()
+
+        # 전달/재전송 지표
+        self._broadcasts = 0
+        self._delivered = 0
+        self._delivery_failures = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._latency_last = 0.0
+        self._replays = 0
+        self._replays_from_db = 0
+        self._replayed_events = 0
+        self._replay_max = 0
+        self._replay_resets = 0
+
+    def set_floor(self, last_event_id: int) -> None:
+        """DB의 마지막 이벤트 ID를 tail 기준점으로 설정(최초 1회)."""
+        with self._lock:
+            if self._floor_id is None:
+                self._floor_id = last_event_id
+            self._head_id = max(self._head_id or 0, last_event_id)
+
+    def append(self, message: dict) -> None:
+        """커밋된 이벤트를 tail에 추가. 넘치는 오래된 이벤트는 DB 재전송으로 넘김."""
+        with self._lock:
+            self._tail.append(message)
+            self._head_id = max(self._head_id or 0, message["event_id"])
+            while len(self._tail) > self._tail_size:
+                evicted = self._tail.popleft()
+                if self._floor_id is not None:
+                    self._floor_id = max(self._floor_id, evicted["event_id"])
+
+    def head_id(self) -> Optional[int]:
+        """현재까지 확인된 마지막 이벤트 ID."""
+        with self._lock:
+            return self._head_id
+
+    def since(self, last_event_id: int) -> Optional[List[dict]]:
+        """커서 이후 이벤트를 tail에서 반환. tail로 커버되지 않으면 None(DB 조회 필요)."""
+        with self._lock:
+            if self._floor_id is None or last_event_id < self._floor_id:
+                return None
+            return [m for m in self._tail if m["event_id"] > last_event_id]
+
+    def record_delivery(self, latency: float, delivered: int) -> None:
+        """브로드캐스트 완료 지표 기록(이벤트 커밋 -> 전송 완료 시간)."""
+        with self._lock:
+            self._broadcasts += 1
+            self._delivered += delivered
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+            self._latency_last = latency
+
+    def record_delivery_failure(self) -> None:
+        """브로드캐스트 실패 기록."""
+        with self._lock:
+            self._delivery_failures += 1
+
+    def record_replay(self, size: int, from_db: bool) -> None:
+        """재접속 재전송 지표 기록."""
+        with self._lock:
+            self._replays += 1
+            if from_db:
+                self._replays_from_db += 1
+            self._replayed_events += size
+            self._replay_max = max(self._replay_max, size)
+
+    def record_replay_reset(self) -> None:
+        """재전송 한도 초과로 reset 안내한 횟수 기록."""
+        with self._lock:
+            self._replay_resets += 1
+
+    def stats(self) -> dict:
+        """현재 지표 스냅샷."""
+        with self._lock:
+            return {
+                "head_event_id": self._head_id,
+                "tail_size": len(self._tail),
+                "broadcasts": self._broadcasts,
+                "delivered": self._delivered,
+                "delivery_failures": self._delivery_failures,
+                "latency_last_ms": self._latency_last * 1000,
+                "latency_max_ms": self._latency_max * 1000,
+                "latency_avg_ms": (
+                    self._latency_total / self._broadcasts * 1000 if self._broadcasts else 0.0
+                ),
+                "replays": self._replays,
+                "replays_from_db": self._replays_from_db,
+                "replayed_events": self._replayed_events,
+                "replay_max": self._replay_max,
+                "replay_resets": self._replay_resets,
+            }
@@ -0,0 +1,137 @@
+import logging
+import math
+import threading
+import time
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+
+def _next_boundary(ts: float, interval: int) -> float:
+    """ts 이후 첫 벽시계 경계(interval의 배수 시각)."""
+    return (math.floor(ts / interval) + 1) * interval
+
+
+class _Job:
+    def __init__(self, name: str, interval: int, func: Callable[[], None]) -> None:
+        self.name = name
+        self.interval = interval
+        self.func = func
+        # 첫 틱은 즉시 실행, 이후부터 경계 정렬
+        self.next_run = time.time()
+        # 틱 지표
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped_ticks = 0
+        self.last_lateness = 0.0
+        self.max_lateness = 0.0
+        self.last_duration = 0.0
+
+
+class TickScheduler:
+    """벽시계 경계에 맞춰 주기 작업을 실행하는 스케줄러(작업마다 전용 스레드).
+
+    작업이 주기보다 오래 걸리면 밀린 틱을 쌓아두지 않고 다음 경계로 건너뛴다.
+    작업별 스레드로 실행하므로 느린 작업이 다른 작업의 틱을 지연시키지 않는다.
+    """
+
+    def __init__(self, stop_event: threading.Event) -> None:
+        self._stop_event = stop_event
+        self._jobs: List[_Job] = []
+        self._threads: List[threading.Thread] = []
+        # 지표 조회(API 스레드) 보호용 락
+        self._lock = threading.Lock()
+
+    def add_job(self, name: str, interval: int, func: Callable[[], None]) -> None:
+        """주기 작업 등록(interval: 초)."""
+        if interval <= 0:
+            raise ValueError(f"interval must be positive: {interval}")
+        self._jobs.append(_Job(name, interval, func))
+
+    def start(self) -> None:
+        """작업별 스레드 시작."""
+        for job in self._jobs:
+            thread = threading.Thread(
+                target=self._job_loop,
+                args=(job,),
+                name=f"scheduler-{job.name}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def join(self, timeout: float) -> None:
+        """작업 스레드 종료 대기(전체 timeout 초 이내)."""
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+    def _job_loop(self, job: _Job) -> None:
+        """stop_event가 설정될 때까지 작업을 경계마다 실행."""
+        while not self._stop_event.is_set():
+            delay = job.next_run - time.time()
+            if delay > 0:
+                self._stop_event.wait(delay)
+                continue
+            self._run_job(job)
+
+    def _run_job(self, job: _Job) -> None:
+        """작업 1회 실행 후 지연/초과 기록 및 다음 경계 계산."""
+        scheduled = job.next_run
+        started = time.time()
+        try:
+            job.func()
+        except Exception:
+            logger.exception("Scheduled job %s failed", job.name)
+        finished = time.time()
+
+        # 다음 실행은 종료 시점 이후 첫 경계 (놓친 틱은 하나로 합쳐 건너뜀)
+        next_run = _next_boundary(finished, job.interval)
+        skipped = max(
+            0,
+            round(next_run / job.interval) - math.floor(scheduled / job.interval + 1e-9) - 1,
+        )
+        lateness = started - scheduled
+
+        with self._lock:
+            job.next_run = next_run
+            job.ticks += 1
+            job.last_lateness = lateness
+            job.max_lateness = max(job.max_lateness, lateness)
+            job.last_duration = finished - started
+            if skipped:
+                job.overruns += 1
+                job.skipped_ticks += skipped
+
+        logger.debug(
+            "Job %s tick: lateness=%.3fs duration=%.3fs",
+            job.name,
+            lateness,
+            finished - started,
+        )
+        if skipped:
+            logger.warning(
+                "Job %s skipped %d tick(s) of %ss interval (lateness=%.3fs duration=%.3fs)",
+                job.name,
+                skipped,
+                job.interval,
+                lateness,
+                finished - started,
+            )
+
+    def stats(self) -> List[dict]:
+        """작업별 틱 지표 스냅샷."""
+        with self._lock:
+            return [
+                {
+                    "name": job.name,
+                    "interval": job.interval,
+                    "ticks": job.ticks,
+                    "overruns": job.overruns,
+                    "skipped_ticks": job.skipped_ticks,
+                    "last_lateness_ms": job.last_lateness * 1000,
+                    "max_lateness_ms": job.max_lateness * 1000,
+                    "last_duration_ms": job.last_duration * 1000,
+                }
+                for job in self._jobs
+            ]
@@ -0,0 +1,51 @@
+import logging
+import threading
+
+from config import AUTO_CREATE_SCHEMA, WARMUP_RETRY_SECONDS
+from database import create_tables
+from services.collector import start_collector
+
+logger = logging.getLogger(__name__)
+
+
+def _warmup_loop(app, stop_event: threading.Event) -> None:
+    """DB 준비 작업(테이블/기본 코인/캐시)을 성공할 때까지 재시도 후 수집 시작."""
+    while not stop_event.is_set():
+        try:
+            if AUTO_CREATE_SCHEMA:
+                # 시작 경로에서는 없는 테이블만 생성 (컬럼/인덱스 변경은 manage.py create-schema)
+                create_tables()
+            if stop_event.is_set():
+                return
+            # 기본 코인/코인 캐시/outbox 기준점 적재 후 수집 스레드 시작.
+            # 같은 stop_event를 넘겨, 종료 이후 늦게 시작되더라도 수집 스레드가 바로 멈추도록 함
+            start_collector(app, stop_event)
+        except Exception:
+            logger.exception("Warmup failed, retrying in %ss", WARMUP_RETRY_SECONDS)
+            stop_event.wait(WARMUP_RETRY_SECONDS)
+            continue
+        if stop_event.is_set():
+            return
+        app.state.ready = True
+        logger.info("Warmup complete")
+        return
+
+
+def start_warmup(app) -> None:
+    """준비 작업 스레드 시작. 완료 전까지 app.state.ready는 False."""
+    app.state.ready = False
+    stop_event = threading.Event()
+    thread = threading.Thread(target=_warmup_loop, args=(app, stop_event), daemon=True)
+    app.state.warmup_stop_event = stop_event
+    app.state.warmup_thread = thread
+    thread.start()
+
+
+def stop_warmup(app) -> None:
+    """준비 작업 스레드 종료."""
+    stop_event = getattr(app.state, "warmup_stop_event", None)
+    thread = getattr(app.state, "warmup_thread", None)
+    if stop_event:
+        stop_event.set()
+    if thread:
+        thread.join(timeout=5)
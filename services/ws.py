@@ -1,5 +1,5 @@
 import asyncio
-from typing import Set
+from typing import Dict, List, Set
 
 from fastapi import WebSocket
 
@@ -8,27 +8,63 @@ class ConnectionManager:
     def __init__(self) -> None:
         # 현재 연결된 웹소켓 목록
         self._active: Set[WebSocket] = set()
+        # 재전송 중인 웹소켓과 그동안 도착한 실시간 메시지 버퍼
+        self._pending: Dict[WebSocket, List[dict]] = {}
         # 동시 접근 보호용 락
         self._lock = asyncio.Lock()
 
-    async def connect(self, websocket: WebSocket) -> None:
-        """웹소켓 연결 승인 및 목록에 추가."""
+    async def connect(self, websocket: WebSocket, buffered: bool = False) -> None:
+        """웹소켓 연결 승인 및 목록에 추가. buffered면 flush_buffered 전까지 실시간 메시지를 보관."""
         await websocket.accept()
         async with self._lock:
-            self._active.add(websocket)
+            if buffered:
+                self._pending[websocket] = []
+            else:
+                self._active.add(websocket)
+
+    async def flush_buffered(self, websocket: WebSocket, last_event_id: int) -> None:
+        """재전송 중 쌓인 메시지를 순서대로 보낸 뒤 일반 브로드캐스트 대상으로 전환.
+
+        last_event_id 이하 이벤트는 재전송에서 이미 보냈으므로 건너뛴다.
+        """
+        while True:
+            async with self._lock:
+                buffered = self._pending.get(websocket)
+                if buffered is None:
+                    return
+                if not buffered:
+                    # 버퍼가 빈 상태에서 전환해야 그 사이 메시지가 누락되지 않음
+                    del self._pending[websocket]
+                    self._active.add(websocket)
+                    return
+                self._pending[websocket] = []
+
+            for payload in buffered:
+                event_id = payload.get("event_id")
+                if event_id is not None and event_id <= last_event_id:
+                    continue
+                await websocket.send_json(payload)
+                if event_id is not None:
+                    last_event_id = event_id
 
     async def disconnect(self, websocket: WebSocket) -> None:
         """웹소켓 연결 해제."""
         async with self._lock:
             self._active.discard(websocket)
+            self._pending.pop(websocket, None)
 
-    async def broadcast_json(self, payload: dict) -> None:
-        """모든 연결에 JSON 브로드캐스트."""
+    async def broadcast_json(self, payload: dict) -> int:
+        """모든 연결에 JSON 브로드캐스트. 전송 성공한 연결 수 반환(재전송 중인 연결은 버퍼에 보관)."""
         async with self._lock:
             sockets = list(self._active)
+            for buffered in self._pending.values():
+                buffered.append(payload)
 
+        delivered = 0
         for websocket in sockets:
             try:
                 await websocket.send_json(payload)
+                delivered += 1
             except Exception:
                 await self.disconnect(websocket)
+        return delivered
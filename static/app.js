@@ -249,19 +249,78 @@ function showAlertNotification(alert) {
   new Notification(title, { body });
 }
 
+function showReplaySummaryNotification(count) {
+  if (!("Notification" in window) || Notification.permission !== "granted") {
+    return;
+  }
+  new Notification("Alerts Triggered", { body: `${count} alert(s) triggered while disconnected` });
+}
+
+let loadAlertsTimer = null;
+
+function scheduleLoadAlerts() {
+  // 연속 이벤트에도 알람 목록은 한 번만 다시 조회
+  if (loadAlertsTimer !== null) {
+    return;
+  }
+  loadAlertsTimer = setTimeout(async () => {
+    loadAlertsTimer = null;
+    try {
+      await loadAlerts();
+    } catch (err) {
+      console.error(err);
+    }
+  }, 500);
+}
+
 function connectAlertSocket() {
   const protocol = location.protocol === "https:" ? "wss" : "ws";
   const socketUrl = `${protocol}://${location.host}/alerts/ws`;
+  // 마지막으로 받은 이벤트 ID (재접속 시 놓친 이벤트 재전송 커서)
+  let lastEventId = null;
+  // 현재 재전송 중 받은 이벤트 수
+  let replayedCount = 0;
   let socket;
 
   function connect() {
-    socket = new WebSocket(socketUrl);
+    const url = lastEventId === null ? socketUrl : `${socketUrl}?last_event_id=${lastEventId}`;
+    replayedCount = 0;
+    socket = new WebSocket(url);
     socket.onmessage = async (event) => {
       try {
         const payload = JSON.parse(event.data);
+        if (payload.type === "hello") {
+          lastEventId = payload.last_event_id;
+          return;
+        }
+        if (payload.type === "reset") {
+          // 놓친 이벤트가 너무 많으면 서버가 커서를 옮기고 전체 재조회를 안내
+          lastEventId = payload.last_event_id;
+          scheduleLoadAlerts();
+          setStatus("Alerts resynced");
+          return;
+        }
+        if (payload.type === "replay_done") {
+          // 재전송된 이벤트는 개별 알림 대신 한 번에 요약
+          if (replayedCount > 0) {
+            showReplaySummaryNotification(replayedCount);
+            scheduleLoadAlerts();
+            setStatus(`${replayedCount} missed alert(s) triggered`);
+          }
+          replayedCount = 0;
+          return;
+        }
+        // 서버가 재전송/실시간 이벤트를 ID 순서대로 보냄
+        if (payload.event_id !== undefined) {
+          lastEventId = payload.event_id;
+        }
         if (payload.type === "alert_triggered") {
+          if (payload.replayed) {
+            replayedCount += 1;
+            return;
+          }
           showAlertNotification(payload.alert);
-          await loadAlerts();
+          scheduleLoadAlerts();
           setStatus("Alert triggered");
         }
       } catch (err) {